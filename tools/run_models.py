@@ -293,8 +293,8 @@ def run_model(
     logger.info(f"Base Docker SHA: {base_docker_sha}")
 
     # Store the data for the run details
-    run_details.base_docker = get_base_docker(model_dockerfile)
-    run_details.docker_sha = get_base_docker_sha(model_docker_image)
+    run_details.base_docker = base_docker
+    run_details.docker_sha = base_docker_sha
     run_details.build_duration = build_duration
 
     # Run the Docker container
@@ -313,8 +313,8 @@ def run_model(
     run_envs = {
         "MAD_MODEL_NAME": model_name,
         "MAD_GPU_VENDOR": get_gpu_vendor(),
-        "MAD_SYSTEM_NGPUS": get_system_gpus(),
-        "MAD_SYSTEM_GPU_ARCHITECTURE": get_system_gpu_arch()
+        "MAD_SYSTEM_NGPUS": run_details.n_gpus,
+        "MAD_SYSTEM_GPU_ARCHITECTURE": run_details.gpu_architecture
     }
     mad_secrets = {}
     for key in os.environ:
@@ -51,27 +51,477 @@ Functions:
     get_base_docker: Get the base Docker image.
     get_base_docker_sha: Get the base Docker image SHA.
     get_host_name: Get the host name.
+    refresh_host_cache: Clear the cached results of the host probes.
     load_models: Load the models from the models.json file.
     read_log_file: Read the log file.
     get_perf_metric: Parse the performance metric.
 """
 
 import urllib
+import ctypes
+import functools
+import mmap
 import os
 import sys
+import atexit
+import hashlib
 import json
 import csv
 import typing
 import subprocess
 import signal
+import threading
+import time
 import re
+import select
+import selectors
+import shlex
+import collections
 import collections.abc
+import concurrent.futures
+import numpy as np
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import docker as docker_sdk
+except ImportError:
+    docker_sdk = None
+
+try:
+    import pynvml
+except ImportError:
+    pynvml = None
+
+try:
+    import amdsmi
+except ImportError:
+    amdsmi = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
 from logger import get_logger
 
 logger = get_logger("MAD")
-logger.removeHandler(logger.handlers[0])
+# Remove the handlers added by get_logger, run_models.py configures the "MAD" logger for each run.
+for handler in list(logger.handlers):
+    logger.removeHandler(handler)
+
+
+@functools.lru_cache(maxsize=1)
+def _docker_client():
+    """Get a client of the Docker daemon, which keeps its connection open across calls.
+
+    Returns:
+        docker.DockerClient: The client, or None if the docker SDK is not installed or the daemon is unreachable.
+    """
+    if docker_sdk is None:
+        return None
+    try:
+        return docker_sdk.from_env()
+    except Exception as e:
+        logger.debug(f"Docker SDK is not usable, falling back to the docker CLI: {e}")
+        return None
+
+
+def _remove_containers(docker_shas: typing.List[str]) -> None:
+    """Remove the containers, whether they are running or not.
+
+    Args:
+        docker_shas (list): The container SHAs.
+
+    Returns:
+        None
+    """
+    client = _docker_client()
+    if client is None:
+        subprocess.run(
+            ["docker", "rm", "-f", *docker_shas],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    else:
+        for docker_sha in docker_shas:
+            try:
+                client.api.remove_container(docker_sha, force=True)
+            except Exception as e:
+                logger.debug(f"Failed to remove the container {docker_sha}: {e}")
+    _invalidate_container_names()
+
+
+def _teardown(docker_sha: str) -> None:
+    """Stop and remove a container.
+
+    Args:
+        docker_sha (str): The container SHA.
+
+    Returns:
+        None
+    """
+    # This runs while the next model logs its output, so keep the teardown out of its log.
+    try:
+        client = _docker_client()
+        if client is None:
+            subprocess.run(
+                ["docker", "stop", "--time=1", docker_sha],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=True,
+            )
+            subprocess.run(
+                ["docker", "rm", "-f", docker_sha],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=True,
+            )
+        else:
+            client.api.stop(docker_sha, timeout=1)
+            client.api.remove_container(docker_sha, force=True)
+    except Exception as e:
+        logger.debug(f"Failed to stop and remove the container {docker_sha}: {e}")
+    _invalidate_container_names()
+
+
+# Containers are stopped and removed in the background, and waited for at exit.
+_TEARDOWN_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+atexit.register(_TEARDOWN_POOL.shutdown, wait=True)
+
+# Stopped containers which can be restarted by a Docker instance with the same configuration.
+_DOCKER_POOL: typing.Dict[str, typing.List[str]] = {}
+_DOCKER_POOL_LOCK = threading.Lock()
+
+
+def _docker_pool_max() -> int:
+    """Get the maximum number of idle containers kept per configuration.
+
+    Returns:
+        int: The value of MAD_DOCKER_POOL_MAX, default 0, which disables the pool.
+    """
+    return int(os.environ.get("MAD_DOCKER_POOL_MAX", "0"))
+
+
+def _docker_image_id(image: str) -> typing.Optional[str]:
+    """Get the ID of a Docker image, so a re-tagged image does not match its old containers.
+
+    Args:
+        image (str): The Docker image.
+
+    Returns:
+        str: The image ID, or None if the image cannot be inspected.
+    """
+    try:
+        client = _docker_client()
+        if client is None:
+            return subprocess.check_output(
+                ["docker", "image", "inspect", "--format", "{{.Id}}", image],
+                stderr=subprocess.DEVNULL,
+            ).decode("utf-8").strip() or None
+        return client.api.inspect_image(image)["Id"]
+    except Exception as e:
+        logger.debug(f"Failed to inspect the image {image}: {e}")
+        return None
+
+
+def _start_container(docker_sha: str) -> bool:
+    """Start a stopped container of the pool.
+
+    Args:
+        docker_sha (str): The container SHA.
+
+    Returns:
+        bool: Whether the container is started.
+    """
+    try:
+        client = _docker_client()
+        if client is None:
+            subprocess.run(
+                ["docker", "start", docker_sha],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=True,
+            )
+        else:
+            client.api.start(docker_sha)
+    except Exception as e:
+        logger.debug(f"Failed to start the container {docker_sha}: {e}")
+        return False
+    return True
+
+
+def _park_container(pool_key: str, docker_sha: str) -> None:
+    """Stop a container, killing its leftover processes, and keep it in the pool if it has room.
+
+    Args:
+        pool_key (str): The key of the container configuration.
+        docker_sha (str): The container SHA.
+
+    Returns:
+        None
+    """
+    try:
+        client = _docker_client()
+        if client is None:
+            subprocess.run(
+                ["docker", "stop", "--time=1", docker_sha],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=True,
+            )
+        else:
+            client.api.stop(docker_sha, timeout=1)
+    except Exception as e:
+        logger.debug(f"Failed to stop the container {docker_sha}: {e}")
+        _remove_containers([docker_sha])
+        return
+
+    with _DOCKER_POOL_LOCK:
+        idle_shas = _DOCKER_POOL.setdefault(pool_key, [])
+        if len(idle_shas) < _docker_pool_max():
+            idle_shas.append(docker_sha)
+            return
+    _remove_containers([docker_sha])
+
+
+def _docker_pool_key(*config) -> str:
+    """Get the pool key of a Docker run configuration.
+
+    Args:
+        config: The Docker run configuration.
+
+    Returns:
+        str: The hash of the configuration.
+    """
+    return hashlib.blake2b(repr(config).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _drain_docker_pool() -> None:
+    """Remove all the idle containers of the pool."""
+    # Wait for the containers still being stopped, so none of them is added after the drain.
+    _TEARDOWN_POOL.shutdown(wait=True)
+    with _DOCKER_POOL_LOCK:
+        docker_shas = [sha for shas in _DOCKER_POOL.values() for sha in shas]
+        _DOCKER_POOL.clear()
+    if docker_shas:
+        _remove_containers(docker_shas)
+
+
+atexit.register(_drain_docker_pool)
+
+# Names of the existing containers, refreshed at most every _CONTAINER_NAMES_TTL seconds.
+_CONTAINER_NAMES_TTL = 2.0
+_container_names_cache: typing.Dict[str, typing.Any] = {"names": frozenset(), "expires": 0.0}
+
+
+def _known_container_names() -> typing.FrozenSet[str]:
+    """Get the names of all the containers, running or not.
+
+    Returns:
+        frozenset: The container names.
+    """
+    now = time.monotonic()
+    if now >= _container_names_cache["expires"]:
+        client = _docker_client()
+        if client is None:
+            names = subprocess.check_output(
+                ["docker", "ps", "-a", "--no-trunc", "--format", "{{.Names}}"]
+            ).decode("utf-8").split()
+        else:
+            names = [
+                name.lstrip("/")
+                for container in client.api.containers(all=True)
+                for name in container["Names"]
+            ]
+        _container_names_cache["names"] = frozenset(names)
+        _container_names_cache["expires"] = now + _CONTAINER_NAMES_TTL
+    return _container_names_cache["names"]
+
+
+def _invalidate_container_names() -> None:
+    """Invalidate the cached container names after creating or removing a container."""
+    _container_names_cache["expires"] = 0.0
+
+
+# Characters with a special meaning for the shell.
+_SHELL_METACHARS_RE = re.compile(r"[|&;<>$`\\*?()\[\]{}\"'~#\n]")
+# The bash builtins and keywords which have no executable of the same name. Inside a
+# container there is no fallback to the shell, so none of them may be run directly.
+_SHELL_BUILTINS = frozenset(
+    {".", ":", "alias", "bg", "bind", "break", "builtin", "caller", "cd", "command",
+     "compgen", "complete", "compopt", "continue", "declare", "dirs", "disown", "enable",
+     "eval", "exec", "exit", "export", "fc", "fg", "getopts", "hash", "help", "history",
+     "jobs", "let", "local", "logout", "mapfile", "popd", "pushd", "read", "readarray",
+     "readonly", "return", "set", "shift", "shopt", "source", "suspend", "times", "trap",
+     "type", "typeset", "ulimit", "umask", "unalias", "unset", "wait",
+     "!", "case", "coproc", "do", "done", "elif", "else", "esac", "fi", "for", "function",
+     "if", "in", "select", "then", "time", "until", "while", "[[", "]]"}
+)
+
+
+def _split_command(command: str) -> typing.Optional[typing.List[str]]:
+    """Split a command into arguments, if it can run without a shell.
+
+    Args:
+        command (str): The shell command.
+
+    Returns:
+        typing.Optional[typing.List[str]]: The arguments, or None if the command needs a shell.
+    """
+    if _SHELL_METACHARS_RE.search(command):
+        return None
+    argv = shlex.split(command)
+    # Shell builtins and leading variable assignments, such as 'FOO=bar cmd', need a shell.
+    if not argv or argv[0] in _SHELL_BUILTINS or "=" in argv[0]:
+        return None
+    return argv
+
+
+# Output retained from a live command, the whole output is still logged.
+_MAX_OUTPUT_BYTES = 4 * 1024 * 1024
+
+
+def _retain_tail(tail: typing.Deque[bytes], chunk: bytes, size: int, max_bytes: int) -> int:
+    """Append a chunk of output, dropping the oldest chunks beyond max_bytes.
+
+    Args:
+        tail (collections.deque): The retained chunks.
+        chunk (bytes): The new chunk.
+        size (int): The size of the retained chunks.
+        max_bytes (int): The maximum size of the retained chunks.
+
+    Returns:
+        int: The new size of the retained chunks.
+    """
+    tail.append(chunk)
+    size += len(chunk)
+    while size > max_bytes and len(tail) > 1:
+        size -= len(tail.popleft())
+    return size
+
+
+class _LiveOutput:
+    """Log live output line by line, only keeping the tail of the output.
+
+    The output arrives in chunks split at arbitrary points, so the partial line at the
+    end of a chunk is kept until the rest of the line arrives.
+    """
+
+    def __init__(self, prefix: str = "", max_output_bytes: int = _MAX_OUTPUT_BYTES) -> None:
+        self.prefix = prefix
+        self.max_output_bytes = max_output_bytes
+        self.tail = collections.deque()
+        self.tail_size = 0
+        self.residue = b""
+
+    def feed(self, chunk: bytes) -> None:
+        """Log the complete lines of a chunk, and keep the partial line for the next chunk."""
+        lines = (self.residue + chunk).split(b"\n")
+        self.residue = lines.pop()
+        for line in lines:
+            stdout_line = line.decode("utf-8", "replace") + "\n"
+            logger.info(f"{self.prefix}{stdout_line}")
+            self.tail_size = _retain_tail(
+                self.tail, line + b"\n", self.tail_size, self.max_output_bytes
+            )
+
+    def close(self) -> str:
+        """Log the last partial line, and return the tail of the output."""
+        if self.residue:
+            stdout_line = self.residue.decode("utf-8", "replace")
+            logger.info(f"{self.prefix}{stdout_line}")
+            self.tail_size = _retain_tail(
+                self.tail, self.residue, self.tail_size, self.max_output_bytes
+            )
+            self.residue = b""
+        return b"".join(self.tail).decode("utf-8", "replace")
+
+
+# Commands up to this length, run without a shell and without live output, are spawned with posix_spawn.
+_FAST_RUN_MAX_COMMAND = 1024
+_HAS_POSIX_SPAWN = hasattr(os, "posix_spawnp") and hasattr(os, "pipe2") and hasattr(select, "poll")
+_SPAWN_SIGDEF = tuple(
+    getattr(signal, name) for name in ("SIGPIPE", "SIGXFSZ") if hasattr(signal, name)
+)
+
+
+def _fast_run(
+    argv: typing.List[str],
+    timeout: typing.Optional[int] = None,
+    env: typing.Optional[typing.Dict] = None,
+) -> typing.Optional[subprocess.CompletedProcess]:
+    """Run a command with posix_spawn, reading its output through a pipe.
+
+    Args:
+        argv (list): The command arguments.
+        timeout (int): The command timeout.
+        env (dict): The environment variables.
+
+    Returns:
+        subprocess.CompletedProcess: The return code and the output, stderr merged into stdout,
+            or None if the command cannot be spawned (e.g. a shell builtin or a missing program).
+
+    Raises:
+        subprocess.TimeoutExpired: If the command times out.
+    """
+    read_fd, write_fd = os.pipe2(os.O_CLOEXEC)
+    try:
+        pid = os.posix_spawnp(
+            argv[0],
+            argv,
+            os.environ if env is None else env,
+            file_actions=[
+                (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+                (os.POSIX_SPAWN_DUP2, write_fd, 1),
+                (os.POSIX_SPAWN_DUP2, write_fd, 2),
+            ],
+            # Reset the signals Python ignores, as Popen does with restore_signals=True.
+            setsigdef=_SPAWN_SIGDEF,
+        )
+    except OSError:
+        # Only the spawn itself is left to the caller's shell fallback.
+        os.close(read_fd)
+        return None
+    except BaseException:
+        os.close(read_fd)
+        raise
+    finally:
+        os.close(write_fd)
+
+    chunks = []
+    deadline = None if timeout is None else time.monotonic() + timeout
+    poller = select.poll()
+    poller.register(read_fd, select.POLLIN)
+    try:
+        # Read the output until EOF, waking up at least every second to check the deadline.
+        while True:
+            wait = 1.0
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired(argv, timeout)
+                wait = min(wait, remaining)
+            if not poller.poll(wait * 1000):
+                continue
+            chunk = os.read(read_fd, 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    except BaseException:
+        # Do not leave the command running on timeout or interruption.
+        os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
+        raise
+    finally:
+        os.close(read_fd)
+
+    _, status = os.waitpid(pid, 0)
+    return subprocess.CompletedProcess(argv, os.waitstatus_to_exitcode(status), b"".join(chunks))
 
 
 # ==================================================================================================
@@ -103,22 +553,24 @@ class Console:
 
     def sh(
         self,
-        command: str,
+        command: typing.Union[str, typing.List[str]],
         can_fail: bool = False,
         timeout: int = 60,
         secret: bool = False,
         prefix: str = "",
         env: typing.Optional[typing.Dict] = None,
+        max_output_bytes: int = _MAX_OUTPUT_BYTES,
     ) -> str:
         """Run a shell command.
 
         Args:
-            command (str): The shell command.
+            command (str or list): The shell command, or the arguments of a command to run without a shell.
             can_fail (bool): Whether the command can fail.
             timeout (int): The command timeout.
             secret (bool): Whether the command is secret.
             prefix (str): The prefix for the output.
             env (dict): The environment variables.
+            max_output_bytes (int): The size of the output tail returned with live output.
 
         Returns:
             str: The shell output.
@@ -126,53 +578,111 @@ class Console:
         Raises:
             RuntimeError: If the command fails.
         """
+        if not isinstance(command, str):
+            argv = list(command)
+            command = shlex.join(argv)
+        else:
+            argv = _split_command(command)
+
         # Print the shell command
         if self.shell_verbose and not secret:
             logger.info(f"> {command}")
             # print("> " + command, flush=True)
 
-        # Run the shell command
-        proc = subprocess.Popen(
-            command,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            shell=True,
-            universal_newlines=True,
-            bufsize=1,
-            env=env,
-        )
-
-        # Get the shell output
-        try:
-            if not self.live_output:
-                # If live output is disabled, read the output at the end, not in real-time.
-                outs, errs = proc.communicate(timeout=timeout)
-                logger.info(f"{prefix}{outs}")
-                if errs:
-                    logger.error(f"{prefix}{errs}")
+        proc = None
+        if (
+            _HAS_POSIX_SPAWN
+            and argv is not None
+            and not self.live_output
+            and len(command) <= _FAST_RUN_MAX_COMMAND
+        ):
+            try:
+                # Spawn short commands with posix_spawn, without the pipe plumbing of Popen.
+                proc = _fast_run(argv, timeout=timeout, env=env)
+            except subprocess.TimeoutExpired as exc:
+                logger.error("Console script timeout")
+                raise RuntimeError("Console script timeout") from exc
+            except Exception as exc:
+                # Handle other exceptions, such as an expired Timeout, without running the command again
+                logger.error("Console script failed")
+                raise RuntimeError("Console script failed") from exc
+            if proc is None:
+                # Leave shell builtins and missing programs to the shell.
+                argv = None
             else:
-                # If live output is enabled, read the output in real-time.
-                outs = []
-                # Read the output line by line
-                for stdout_line in iter(proc.stdout.readline, ""):
-                    logger.info(f"{prefix}{stdout_line}")
-                    # print(prefix + stdout_line, end="")
-                    outs.append(stdout_line)
-
-                # Join the output lines
-                outs = "".join(outs)
-                proc.stdout.close()
-                proc.wait(timeout=timeout)
-        except subprocess.TimeoutExpired as exc:
-            # Kill the process if it times out
-            logger.error("Console script timeout")
-            proc.kill()
-            raise RuntimeError("Console script timeout") from exc
-        except Exception as exc:
-            # Handle other exceptions
-            logger.error("Console script failed")
-            raise RuntimeError("Console script failed") from exc
+                outs = proc.stdout.decode("utf-8", "replace")
+                logger.info(f"{prefix}{outs}")
+
+        if proc is None:
+            # Run the shell command, reading its output as bytes through a large buffer.
+            popen_kwargs = dict(
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                bufsize=65536,
+                env=env,
+            )
+            if argv is not None:
+                try:
+                    # Run the command directly, without the fork and exec of /bin/sh.
+                    proc = subprocess.Popen(argv, shell=False, **popen_kwargs)
+                except OSError:
+                    # Leave shell builtins and missing programs to the shell.
+                    proc = None
+            if proc is None:
+                proc = subprocess.Popen(command, shell=True, **popen_kwargs)
+
+            # Get the shell output
+            try:
+                if not self.live_output:
+                    # If live output is disabled, read the output at the end, not in real-time.
+                    outs, errs = proc.communicate(timeout=timeout)
+                    # Decode the output once, instead of line by line.
+                    outs = outs.decode("utf-8", "replace")
+                    logger.info(f"{prefix}{outs}")
+                    if errs:
+                        logger.error(f"{prefix}{errs.decode('utf-8', 'replace')}")
+                else:
+                    # If live output is enabled, read the output in real-time, only keeping its tail.
+                    live_output = _LiveOutput(prefix, max_output_bytes)
+                    deadline = None if timeout is None else time.monotonic() + timeout
+                    fd = proc.stdout.fileno()
+                    os.set_blocking(fd, False)
+                    with selectors.DefaultSelector() as selector:
+                        selector.register(fd, selectors.EVENT_READ)
+                        # Read the output in chunks until EOF, waking up at least every second to check the deadline.
+                        while True:
+                            wait = 1.0
+                            if deadline is not None:
+                                remaining = deadline - time.monotonic()
+                                if remaining <= 0:
+                                    raise subprocess.TimeoutExpired(command, timeout)
+                                wait = min(wait, remaining)
+                            if not selector.select(timeout=wait):
+                                continue
+                            try:
+                                chunk = os.read(fd, 65536)
+                            except BlockingIOError:
+                                continue
+                            if not chunk:
+                                break
+                            live_output.feed(chunk)
+
+                    # Join the output lines
+                    outs = live_output.close()
+                    proc.stdout.close()
+                    proc.wait(
+                        timeout=None if deadline is None else max(0, deadline - time.monotonic())
+                    )
+            except subprocess.TimeoutExpired as exc:
+                # Kill the process if it times out
+                logger.error("Console script timeout")
+                proc.kill()
+                raise RuntimeError("Console script timeout") from exc
+            except Exception as exc:
+                # Handle other exceptions
+                logger.error("Console script failed")
+                raise RuntimeError("Console script failed") from exc
 
         # Check the return code,
         # if the command fails, raise an exception,
@@ -211,6 +721,7 @@ class Docker:
         console (Console): The console.
         userid (str): The user ID.
         groupid (str): The group ID.
+        pool_key (str): The key of the container configuration in the pool of idle containers.
 
     Methods:
         sh: Run a shell command in the Docker container.
@@ -249,16 +760,45 @@ class Docker:
         # Initialize the variables of the Docker class.
         self.docker_sha = None
         self.keep_alive = keep_alive
+        self.pool_key = None
         cwd = os.getcwd()
         self.console = console
-        self.userid = self.console.sh("id -u")
-        self.groupid = self.console.sh("id -g")
+        if hasattr(os, "getuid"):
+            # Avoid spawning a shell just to read the user and group IDs.
+            self.userid = str(os.getuid())
+            self.groupid = str(os.getgid())
+        else:
+            self.userid = self.console.sh("id -u")
+            self.groupid = self.console.sh("id -g")
+
+        # Reuse an idle container of the same image ID and configuration, if the pool is enabled.
+        image_id = _docker_image_id(image) if _docker_pool_max() > 0 else None
+        if image_id is not None:
+            self.pool_key = _docker_pool_key(
+                image_id,
+                docker_opts,
+                sorted(mounts or []),
+                sorted((env_vars or {}).items()),
+                cwd,
+                self.userid,
+                self.groupid,
+            )
+            while True:
+                with _DOCKER_POOL_LOCK:
+                    idle_shas = _DOCKER_POOL.get(self.pool_key)
+                    docker_sha = idle_shas.pop() if idle_shas else None
+                if docker_sha is None:
+                    break
+                if _start_container(docker_sha):
+                    self.docker_sha = docker_sha
+                    logger.info(
+                        f"Reusing the Docker container {self.docker_sha} for {container_name}"
+                    )
+                    return
+                _remove_containers([docker_sha])
 
         # Check if container name exists, if yes, raise error, else proceed.
-        container_name_exists = self.console.sh(
-            "docker container ps -a | grep " + container_name + " | wc -l"
-        )
-        if container_name_exists != "0":
+        if container_name in _known_container_names():
             logger.error(
                 "Container with name, "
                 + container_name
@@ -272,53 +812,60 @@ class Docker:
                 + "Please stop (docker stop --time=1 SHA) and remove this (docker rm -f SHA) to proceed.."
             )
 
-        # Build the docker run command
-        command = (
-            "docker run -t -d -u "
-            + self.userid
-            + ":"
-            + self.groupid
-            + " "
-            + docker_opts
-            + " "
-        )
+        # Build the docker run command as a list of arguments, run without a shell.
+        argv = ["docker", "run", "-t", "-d", "-u", self.userid + ":" + self.groupid]
+        argv.extend(shlex.split(docker_opts))
         # Add mounts, if any.
         if mounts is not None:
             for mount in mounts:
-                command += "-v " + mount + ":" + mount + " "
+                argv.extend(["-v", mount + ":" + mount])
 
         # Add current working directory as mount.
-        command += "-v " + cwd + ":/myworkspace/ "
+        argv.extend(["-v", cwd + ":/myworkspace/"])
 
         # Add environment variables, if any.
         if env_vars is not None:
             # Iterate over the environment variables and add them to the command.
             for evar in env_vars.keys():
-                command += "-e " + evar + "=" + env_vars[evar] + " "
+                argv.extend(["-e", evar + "=" + env_vars[evar]])
 
         # Add the image and container name to the command.
-        command += "--workdir /myworkspace/ "
-        command += "--name " + container_name + " "
-        command += image + " "
+        argv.extend(["--workdir", "/myworkspace/"])
+        argv.extend(["--name", container_name])
+        argv.append(image)
 
         # Hack to keep the container alive.
-        command += "cat "
+        argv.append("cat")
 
         # Run the docker run command.
-        self.console.sh(command)
-
-        # Get the SHA of the container.
-        self.docker_sha = self.console.sh(
-            "docker ps -aqf 'name=" + container_name + "' "
-        )
+        self.console.sh(argv)
+        _invalidate_container_names()
+
+        # Get the SHA of the container, filtering on the exact container name.
+        name_filter = "^" + container_name + "$"
+        client = _docker_client()
+        if client is None:
+            self.docker_sha = self.console.sh(
+                ["docker", "ps", "-aq", "--filter", "name=" + name_filter]
+            )
+        else:
+            containers = client.api.containers(all=True, filters={"name": name_filter})
+            self.docker_sha = "\n".join(container["Id"][:12] for container in containers)
 
-    def sh(self, command: str, timeout: int = 60, secret: bool = False) -> str:
+    def sh(
+        self,
+        command: typing.Union[str, typing.List[str]],
+        timeout: int = 60,
+        secret: bool = False,
+        prefix: str = "",
+    ) -> str:
         """Run a shell command in the Docker container.
 
         Args:
-            command (str): The shell command.
+            command (str or list): The shell command, or the arguments of a command to run without a shell.
             timeout (int): The command timeout.
             secret (bool): Whether the command is secret.
+            prefix (str): The prefix for the output.
 
         Returns:
             str: The shell output.
@@ -329,12 +876,117 @@ class Docker:
         Note:
             The command is run as root.
         """
+        if isinstance(command, str):
+            argv = _split_command(command)
+            if argv is None:
+                # Only commands using shell syntax need bash in the container.
+                argv = ["bash", "-c", command]
+        else:
+            argv = list(command)
+
+        client = _docker_client()
+        if client is not None:
+            return self._exec(client, argv, timeout=timeout, secret=secret, prefix=prefix)
+
         return self.console.sh(
-            "docker exec " + self.docker_sha + ' bash -c "' + command + '"',
+            ["docker", "exec", self.docker_sha, *argv],
             timeout=timeout,
             secret=secret,
+            prefix=prefix,
         )
 
+    def _exec(
+        self,
+        client,
+        argv: typing.List[str],
+        timeout: typing.Optional[int] = 60,
+        secret: bool = False,
+        prefix: str = "",
+    ) -> str:
+        """Run a command in the Docker container through the Docker SDK.
+
+        Args:
+            client (docker.DockerClient): The Docker client.
+            argv (list): The command arguments.
+            timeout (int): The command timeout.
+            secret (bool): Whether the command is secret.
+            prefix (str): The prefix for the output.
+
+        Returns:
+            str: The command output.
+
+        Raises:
+            RuntimeError: If the command fails or times out.
+        """
+        command = "docker exec " + self.docker_sha + " " + shlex.join(argv)
+        if self.console.shell_verbose and not secret:
+            logger.info(f"> {command}")
+
+        result = {}
+        stopped = threading.Event()
+
+        def run() -> None:
+            try:
+                exec_id = client.api.exec_create(self.docker_sha, argv)["Id"]
+                stream = client.api.exec_start(exec_id, stream=True)
+                result["stream"] = stream
+                if self.console.live_output:
+                    # Log the output line by line, as Console.sh does with live output.
+                    live_output = _LiveOutput(prefix)
+                    for chunk in stream:
+                        if stopped.is_set():
+                            return
+                        live_output.feed(chunk)
+                    result["outs"] = live_output.close()
+                else:
+                    result["outs"] = b"".join(stream).decode("utf-8", "replace")
+                result["returncode"] = client.api.exec_inspect(exec_id)["ExitCode"]
+            except Exception as exc:
+                if not stopped.is_set():
+                    result["exc"] = exc
+
+        # The SDK has no timeout for exec, so wait for the command in a daemon thread.
+        thread = threading.Thread(target=run, daemon=True)
+
+        def stop_reading() -> None:
+            # Stop reading the output, so the command does not keep logging after the timeout.
+            stopped.set()
+            if hasattr(result.get("stream"), "close"):
+                try:
+                    result["stream"].close()
+                except Exception:
+                    pass
+
+        thread.start()
+        try:
+            thread.join(timeout)
+        except BaseException as exc:
+            # An enclosing Timeout, or an interrupt, fired while waiting for the command.
+            stop_reading()
+            if not isinstance(exc, Exception):
+                raise
+            logger.error("Console script failed")
+            raise RuntimeError("Console script failed") from exc
+        if thread.is_alive():
+            stop_reading()
+            logger.error("Console script timeout")
+            raise RuntimeError("Console script timeout")
+        if "exc" in result:
+            logger.error("Console script failed")
+            raise RuntimeError("Console script failed") from result["exc"]
+
+        outs = result["outs"]
+        if not self.console.live_output:
+            logger.info(f"{prefix}{outs}")
+        if result["returncode"] != 0:
+            if secret:
+                command = "docker exec " + self.docker_sha + " <secret>"
+            logger.error(f"Subprocess '{command}' failed with exit code {result['returncode']}")
+            raise RuntimeError(
+                f"Subprocess '{command}' failed with exit code {result['returncode']}"
+            )
+        return outs.strip()
+
     def __del__(self):
         """Delete the Docker container.
 
@@ -343,12 +995,28 @@ class Docker:
 
         Note:
             If the keep_alive flag is set, the Docker container is kept alive.
+            Otherwise, if MAD_DOCKER_POOL_MAX is set, the container is stopped and kept
+            in the pool, up to MAD_DOCKER_POOL_MAX per configuration, and removed at exit.
         """
+        if not self.keep_alive and self.docker_sha and self.pool_key:
+            # If keep_alive is False and the pool is enabled, stop the Docker container for reuse.
+            logger.info("Stopping the Docker container and returning it to the pool")
+            try:
+                _TEARDOWN_POOL.submit(_park_container, self.pool_key, self.docker_sha)
+            except RuntimeError:
+                # The pool is shut down when the interpreter exits.
+                _remove_containers([self.docker_sha])
+            return
+
         if not self.keep_alive and self.docker_sha:
             # If keep_alive is False, stop and remove the Docker container.
             logger.info("Stopping and removing the Docker container")
-            self.console.sh("docker stop --time=1 " + self.docker_sha)
-            self.console.sh("docker rm -f " + self.docker_sha)
+            try:
+                # Tear down in the background, so the next model can start meanwhile.
+                _TEARDOWN_POOL.submit(_teardown, self.docker_sha)
+            except RuntimeError:
+                # The pool is shut down when the interpreter exits.
+                _teardown(self.docker_sha)
             return
 
         if self.docker_sha:
@@ -368,21 +1036,36 @@ class Timeout:
 
     Attributes:
         seconds (int): The timeout in seconds.
+        use_signal (bool): Whether to use SIGALRM, or a timer thread.
 
     Methods:
         handle_timeout: Handle the timeout.
+
+    Note:
+        SIGALRM only works in the main thread and there is a single alarm per process.
+        In other threads, a timer raises TimeoutError asynchronously in the thread
+        which entered the context, at its next Python bytecode.
     """
 
-    def __init__(self, seconds: int = 15) -> None:
+    def __init__(self, seconds: int = 15, use_signal: typing.Optional[bool] = None) -> None:
         """Initialize the Timeout class.
 
         Args:
-            seconds (int): The timeout in seconds.
+            seconds (int): The timeout in seconds, 0 for no timeout.
+            use_signal (bool): Whether to use SIGALRM, default only in the main thread.
 
         Returns:
             None
         """
         self.seconds = seconds
+        self.use_signal = use_signal
+        self._previous_handler = None
+        self._signal_mode = False
+        self._outer_alarm = 0
+        self._entered_at = 0.0
+        self._timer = None
+        self._target_tid = None
+        self._lock = threading.Lock()
 
     def handle_timeout(self, signum, frame):
         """Handle the timeout.
@@ -400,14 +1083,65 @@ class Timeout:
         logger.error("TimeoutError: Program timed out")
         raise TimeoutError("Program timed out. Requested timeout=" + str(self.seconds))
 
+    def _raise_in_target(self) -> None:
+        """Raise TimeoutError in the thread which entered the context."""
+        with self._lock:
+            if self._target_tid is None:
+                return
+            logger.error("TimeoutError: Program timed out")
+            ctypes.pythonapi.PyThreadState_SetAsyncExc(
+                ctypes.c_ulong(self._target_tid), ctypes.py_object(TimeoutError)
+            )
+
     def __enter__(self) -> None:
         """Enter the timeout context."""
-        signal.signal(signal.SIGALRM, self.handle_timeout)
-        signal.alarm(self.seconds)
+        use_signal = self.use_signal
+        if use_signal is None:
+            use_signal = threading.current_thread() is threading.main_thread()
+
+        if use_signal:
+            self._signal_mode = True
+            self._entered_at = time.monotonic()
+            self._previous_handler = signal.signal(signal.SIGALRM, self.handle_timeout)
+            # Keep the remaining seconds of an enclosing alarm, to re-arm it on exit.
+            self._outer_alarm = signal.alarm(self.seconds)
+            if self._outer_alarm and (not self.seconds or self._outer_alarm < self.seconds):
+                # The enclosing alarm is due first, so keep it.
+                signal.alarm(self._outer_alarm)
+        elif self.seconds:
+            self._target_tid = threading.get_ident()
+            self._timer = threading.Timer(self.seconds, self._raise_in_target)
+            self._timer.daemon = True
+            self._timer.start()
 
     def __exit__(self, type, value, traceback) -> None:
         """Exit the timeout context."""
-        signal.alarm(0)
+        if self._timer is not None:
+            with self._lock:
+                self._target_tid = None
+            self._timer.cancel()
+            self._timer = None
+        elif self._signal_mode:
+            signal.alarm(0)
+            # signal.signal() returns None for a handler not installed from Python.
+            previous_handler = self._previous_handler
+            signal.signal(
+                signal.SIGALRM,
+                signal.SIG_DFL if previous_handler is None else previous_handler,
+            )
+            self._previous_handler = None
+            self._signal_mode = False
+
+            # Re-arm the enclosing alarm with its remaining time, or fire it if it is overdue.
+            if self._outer_alarm:
+                remaining = self._outer_alarm - (time.monotonic() - self._entered_at)
+                self._outer_alarm = 0
+                if remaining > 0:
+                    signal.alarm(max(1, round(remaining)))
+                elif callable(previous_handler):
+                    previous_handler(signal.SIGALRM, None)
+                else:
+                    raise TimeoutError("Program timed out")
 
 
 class RunDetails:
@@ -436,9 +1170,40 @@ class RunDetails:
         __init__: Initialize the RunDetails class.
         print_summary: Print the performance metrics.
         print_perf_metric: Print the performance metrics.
+        report_fields: Get the columns of the performance report.
+        output_dict: Get the run details as a row of the performance report.
+        generate_json: Generate the performance json.
         generate_report: Generate the performance report.
+        flush_batch: Append a batch of run details to the performance report.
     """
 
+    # Columns of the performance report and json, in order.
+    REPORT_FIELDS = (
+        "model",
+        "pipeline",
+        "tags",
+        "args",
+        "docker_file",
+        "base_docker",
+        "docker_sha",
+        "docker_image",
+        "machine_name",
+        "host_os",
+        "gpu_architecture",
+        "n_gpus",
+        "training_precision",
+        "performance",
+        "metric",
+        "status",
+        "build_duration",
+        "test_duration",
+        "git_commit",
+        "relative_change",
+    )
+    # Columns left out when the performance comes from a multiple results csv.
+    MULTIPLE_RESULTS_EXCLUDED_FIELDS = frozenset({"model", "performance", "metric", "status"})
+    _warned_extra_fields = False
+
     def __init__(self) -> None:
         """Initialize the RunDetails class."""
         self.model = ""
@@ -483,6 +1248,34 @@ class RunDetails:
             f"{self.model} performance is {self.performance} {self.metric}"
         )
 
+    def report_fields(self, multiple_results: bool = False) -> typing.List[str]:
+        """Get the columns of the performance report.
+
+        Args:
+            multiple_results (bool): Whether there are multiple results.
+
+        Returns:
+            list: The columns, in order.
+        """
+        if not multiple_results:
+            return list(self.REPORT_FIELDS)
+        return [x for x in self.REPORT_FIELDS if x not in self.MULTIPLE_RESULTS_EXCLUDED_FIELDS]
+
+    def output_dict(self, multiple_results: bool = False) -> typing.Dict:
+        """Get the run details as a row of the performance report.
+
+        Args:
+            multiple_results (bool): Whether there are multiple results.
+
+        Returns:
+            dict: The run details, keyed by the columns of the performance report.
+        """
+        extra_fields = vars(self).keys() - set(self.REPORT_FIELDS)
+        if extra_fields and not RunDetails._warned_extra_fields:
+            RunDetails._warned_extra_fields = True
+            logger.warning(f"Run details not in the performance report: {sorted(extra_fields)}")
+        return {x: getattr(self, x) for x in self.report_fields(multiple_results)}
+
     def generate_json(self, json_name, multiple_results=False):
         """Generate the performance json.
 
@@ -493,15 +1286,16 @@ class RunDetails:
         Returns:
             None
         """
-        keys_to_exclude = (
-            {"model", "performance", "metric", "status"}
-            if multiple_results
-            else {}
-        )
-        attributes = vars(self)
-        output_dict = {x: attributes[x] for x in attributes if x not in keys_to_exclude}
-        with open(json_name, "w") as f:
-            json.dump(output_dict, f, indent=4)
+        output_dict = self.output_dict(multiple_results)
+        # Serialize the json at once, with orjson if it is installed, and write it in one call.
+        if orjson is not None:
+            data = orjson.dumps(
+                output_dict, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            )
+        else:
+            data = json.dumps(output_dict, indent=4).encode("utf-8")
+        with open(json_name, "wb") as f:
+            f.write(data)
 
     def generate_report(
         self, report_name: str, are_multiple_results: bool = False
@@ -509,32 +1303,129 @@ class RunDetails:
         """Generate the performance report.
 
         Args:
-            report_name (str): The report name which is a json file.
+            report_name (str): The report name which is a csv file.
             are_multiple_results (bool): Whether there are multiple results.
 
         Returns:
             None
         """
-        keys_to_exclude = (
-            {"model", "performance", "metric", "status"}
-            if are_multiple_results
-            else {}
+        output_dict = self.output_dict(are_multiple_results)
+
+        # Write the output_dict to the csv file output, which is kept open across calls.
+        writer = _get_report_writer(report_name, self.report_fields(are_multiple_results))
+        writer.writerow(output_dict)
+
+    @classmethod
+    def flush_batch(
+        cls,
+        records: typing.List["RunDetails"],
+        report_name: str,
+        are_multiple_results: bool = False,
+    ) -> None:
+        """Append a batch of run details to the performance report at once.
+
+        Args:
+            records (list): The run details.
+            report_name (str): The report name which is a csv file.
+            are_multiple_results (bool): Whether there are multiple results.
+
+        Returns:
+            None
+        """
+        if not records:
+            return
+        batch_df = pd.DataFrame(
+            [record.output_dict(are_multiple_results) for record in records],
+            columns=records[0].report_fields(are_multiple_results),
+        )
+
+        # Flush the rows buffered by generate_report first, to keep the rows in order.
+        writer = _report_writers.get(os.path.abspath(report_name))
+        if writer is not None:
+            writer.flush()
+
+        write_header = not os.path.exists(report_name) or os.path.getsize(report_name) == 0
+        # Use the line terminator of csv.DictWriter, so both can append to the same report.
+        batch_df.to_csv(
+            report_name, mode="a", header=write_header, index=False, lineterminator="\r\n"
         )
-        attributes = vars(self)
-        output_dict = {x: attributes[x] for x in attributes if x not in keys_to_exclude}
-
-        # Write the output_dict to the csv file output.
-        if os.path.isfile(report_name) and os.path.getsize(report_name) > 0:
-            # Append the output_dict to the existing file.
-            with open(report_name, "a") as f:
-                w = csv.DictWriter(f, output_dict.keys())
-                w.writerow(output_dict)
-        else:
-            # Write the output_dict to a new file.
-            with open(report_name, "w") as f:
-                w = csv.DictWriter(f, output_dict.keys())
-                w.writeheader()
-                w.writerow(output_dict)
+
+
+class _ReportWriter:
+    """A csv report kept open in append mode across rows.
+
+    Attributes:
+        path (str): The report path.
+    """
+
+    def __init__(self, path: str, fieldnames: typing.Iterable[str]) -> None:
+        """Open the report, and write the header if the report is empty.
+
+        Args:
+            path (str): The report path.
+            fieldnames (list): The report columns.
+        """
+        self.path = path
+        self._f = open(path, "a", newline="")
+        self._w = csv.DictWriter(self._f, list(fieldnames), extrasaction="ignore")
+        if self._f.tell() == 0:
+            self._w.writeheader()
+            self._f.flush()
+
+    def writerow(self, row: typing.Dict) -> None:
+        """Write a row to the report, flushing it so readers and crashes do not lose it."""
+        self._w.writerow(row)
+        self._f.flush()
+
+    def is_current(self) -> bool:
+        """Check that the report was not deleted or replaced, e.g. by a log rotation."""
+        try:
+            return os.stat(self.path).st_ino == os.fstat(self._f.fileno()).st_ino
+        except OSError:
+            return False
+
+    def flush(self) -> None:
+        """Flush the buffered rows to the report."""
+        self._f.flush()
+
+    def close(self) -> None:
+        """Close the report."""
+        self._f.close()
+
+
+# Open reports, keyed by absolute path.
+_report_writers: typing.Dict[str, _ReportWriter] = {}
+
+
+def _get_report_writer(report_name: str, fieldnames: typing.Iterable[str]) -> _ReportWriter:
+    """Get the open writer of a report, opening it on first use.
+
+    Args:
+        report_name (str): The report name which is a csv file.
+        fieldnames (list): The report columns, used when the report is opened.
+
+    Returns:
+        _ReportWriter: The report writer.
+    """
+    path = os.path.abspath(report_name)
+    writer = _report_writers.get(path)
+    if writer is not None and not writer.is_current():
+        # Reopen a report which was deleted or replaced, instead of writing to the old file.
+        writer.close()
+        writer = None
+    if writer is None:
+        writer = _report_writers[path] = _ReportWriter(path, fieldnames)
+    return writer
+
+
+def _close_report_writers() -> None:
+    """Close all the open reports."""
+    for writer in _report_writers.values():
+        writer.close()
+    _report_writers.clear()
+
+
+atexit.register(_close_report_writers)
 
 
 # ==================================================================================================
@@ -543,12 +1434,83 @@ class RunDetails:
 
 from typing import List
 
+# Patterns of the performance metric in the logs, and of the GPU architecture, such as A100 or gfx90a.
+# The log pattern is bytes, to scan the memory-mapped log files without decoding them,
+# and captures both the performance and the metric which follows it.
+_PERF_RE = re.compile(rb"performance:\s*([+-]?\d*\.?\d*)\s*(\w*)")
+_NVIDIA_ARCH_RE = re.compile(r"([AHV])(\d{3})")
+_AMD_ARCH_RE = re.compile(r"gfx.*")
+_BASE_DOCKER_RE = re.compile(r"^\s*ARG\s+BASE_DOCKER\s*=\s*(.+?)\s*$")
+
 def subprocess_run(cmd: List[str]):
     import subprocess
 
     return subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
 
 
+@functools.lru_cache(maxsize=1)
+def _nvml_available() -> bool:
+    """Initialize NVML, the library behind nvidia-smi.
+
+    Returns:
+        bool: Whether the NVML Python bindings are installed and NVML is initialized.
+    """
+    if pynvml is None:
+        return False
+    try:
+        pynvml.nvmlInit()
+    except Exception as e:
+        logger.debug(f"NVML is not usable: {e}")
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=1)
+def _amdsmi_available() -> bool:
+    """Initialize AMD SMI, the library behind amd-smi.
+
+    Returns:
+        bool: Whether the AMD SMI Python bindings are installed and AMD SMI finds GPUs.
+    """
+    if amdsmi is None:
+        return False
+    try:
+        amdsmi.amdsmi_init()
+        return len(amdsmi.amdsmi_get_processor_handles()) > 0
+    except Exception as e:
+        logger.debug(f"AMD SMI is not usable: {e}")
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def _query_nvidia_once() -> typing.Tuple[int, str]:
+    """Query the number and the name of the NVIDIA GPUs at once.
+
+    Returns:
+        typing.Tuple[int, str]: The number of GPUs, and the name of the first GPU.
+    """
+    if _nvml_available():
+        gpu_count = pynvml.nvmlDeviceGetCount()
+        gpu_name = pynvml.nvmlDeviceGetName(pynvml.nvmlDeviceGetHandleByIndex(0))
+        # Older NVML bindings return bytes.
+        if isinstance(gpu_name, bytes):
+            gpu_name = gpu_name.decode("utf-8")
+        return gpu_count, gpu_name
+
+    # One line per GPU, so the lines give both the count and the name.
+    lines = [
+        line.strip()
+        for line in subprocess.check_output(
+            ["nvidia-smi", "--query-gpu=name", "--format=csv,noheader"]
+        )
+        .decode("utf-8")
+        .splitlines()
+        if line.strip()
+    ]
+    return len(lines), lines[0] if lines else ""
+
+
+@functools.lru_cache(maxsize=None)
 def get_gpu_vendor() -> str:
     """Get the GPU vendor.
 
@@ -558,22 +1520,33 @@ def get_gpu_vendor() -> str:
     Raises:
         Exception: If the GPU vendor is not NVIDIA or AMD.
     """
-    # checks both command not installed, and installed but not working
-    ERRORS = (FileNotFoundError, subprocess.CalledProcessError)
-
-    try:
-        _ = subprocess_run(["/usr/bin/nvidia-smi"])
+    # Probe the GPU drivers on the filesystem first, then query the GPU libraries
+    # in-process if their bindings are installed, and last run the SMI tools.
+    if os.path.exists("/proc/driver/nvidia/version"):
+        gpu_vendor = "NVIDIA"
+    elif os.path.exists("/dev/kfd"):
+        gpu_vendor = "AMD"
+    elif _nvml_available():
+        gpu_vendor = "NVIDIA"
+    elif _amdsmi_available():
+        gpu_vendor = "AMD"
+    else:
+        # checks both command not installed, and installed but not working
+        ERRORS = (FileNotFoundError, subprocess.CalledProcessError)
 
-    except ERRORS as e1:
         try:
-            _ = subprocess_run(["/opt/rocm/bin/rocm-smi"])
+            _ = subprocess_run(["/usr/bin/nvidia-smi"])
+
+        except ERRORS as e1:
+            try:
+                _ = subprocess_run(["/opt/rocm/bin/rocm-smi"])
 
-        except ERRORS as e2:
-            raise Exception("Unsupported GPU: Neither AMD nor NVIDIA")
+            except ERRORS as e2:
+                raise Exception("Unsupported GPU: Neither AMD nor NVIDIA")
+            else:
+                gpu_vendor = "AMD"
         else:
-            gpu_vendor = "AMD"
-    else:
-        gpu_vendor = "NVIDIA"
+            gpu_vendor = "NVIDIA"
 
     logger.debug(f"GPU vendor: {gpu_vendor}")
     return gpu_vendor
@@ -599,20 +1572,52 @@ def get_dockerfile_gpu_suffix() -> str:
         return ""
 
 
+# The host operating system of each distribution ID in /etc/os-release.
+_OS_RELEASE_IDS = {
+    "ubuntu": "HOST_UBUNTU",
+    "debian": "HOST_UBUNTU",
+    "centos": "HOST_CENTOS",
+    "rhel": "HOST_CENTOS",
+    "fedora": "HOST_CENTOS",
+    "rocky": "HOST_CENTOS",
+    "almalinux": "HOST_CENTOS",
+    "sles": "HOST_SLES",
+    "opensuse-leap": "HOST_SLES",
+    "opensuse": "HOST_SLES",
+    "suse": "HOST_SLES",
+}
+
+
+@functools.lru_cache(maxsize=None)
 def get_host_os() -> str:
     """Get the host operating system.
 
     Returns:
         str: The host operating system.
+
+    Raises:
+        Exception: If the host operating system is not supported.
     """
-    if os.path.exists("/usr/bin/apt"):
-        host_os = "HOST_UBUNTU"
-    elif os.path.exists("/usr/bin/yum"):
-        host_os = "HOST_CENTOS"
-    elif os.path.exists("/usr/bin/zypper"):
-        host_os = "HOST_SLES"
+    os_release = {}
+    for path in ("/etc/os-release", "/usr/lib/os-release"):
+        try:
+            with open(path, "r") as f:
+                for line in f:
+                    if "=" in line:
+                        key, value = line.strip().split("=", 1)
+                        os_release[key] = value.strip("\"'")
+            break
+        except FileNotFoundError:
+            continue
+
+    # Match the distribution ID first, then the distributions it is derived from.
+    distro_ids = [os_release.get("ID", "")] + os_release.get("ID_LIKE", "").split()
+    for distro_id in distro_ids:
+        if distro_id in _OS_RELEASE_IDS:
+            host_os = _OS_RELEASE_IDS[distro_id]
+            break
     else:
-        raise Exception(f"Unsupported host OS: {host_os}")
+        raise Exception(f"Unsupported host OS: {os_release.get('ID', 'unknown')}")
 
     logger.info(f"Host OS: {host_os}")
     return host_os
@@ -640,17 +1645,21 @@ def get_dockerfile_linux_suffix() -> str:
         return ""
 
 
+# The number of CPUs does not change while MAD runs, so count them once.
+_NUM_CPUS = os.cpu_count()
+
+
 def get_system_cpus() -> int:
     """Get the number of CPUs in the system.
 
     Returns:
         int: The number of CPUs in the system.
     """
-    number_cpus = os.cpu_count()
-    logger.info(f"Number of CPUs: {number_cpus}")
-    return number_cpus
+    logger.debug(f"Number of CPUs: {_NUM_CPUS}")
+    return _NUM_CPUS
 
 
+@functools.lru_cache(maxsize=None)
 def get_system_gpus() -> int:
     """Get the number of GPUs in the system.
 
@@ -665,16 +1674,15 @@ def get_system_gpus() -> int:
         sys.exit(1)
 
     if gpu_vendor == "NVIDIA":
-        number_gpus = int(
-            subprocess.check_output(
-                "nvidia-smi --query-gpu=count --format=csv,noheader | head -n 1", shell=True
-            )
-        )
+        number_gpus, _ = _query_nvidia_once()
+    elif gpu_vendor == "AMD" and _amdsmi_available():
+        number_gpus = len(amdsmi.amdsmi_get_processor_handles())
     elif gpu_vendor == "AMD":
-        number_gpus = int(
-            subprocess.check_output(
-                "rocm-smi --showid --csv | grep card | wc -l", shell=True
-            )
+        # Count the lines of the cards.
+        number_gpus = sum(
+            1
+            for line in subprocess.check_output(["rocm-smi", "--showid", "--csv"]).splitlines()
+            if b"card" in line
         )
     else:
         raise Exception(f"Unsupported GPU vendor: {gpu_vendor}")
@@ -683,12 +1691,27 @@ def get_system_gpus() -> int:
     return number_gpus
 
 
+_KFD_TOPOLOGY_NODES = "/sys/devices/virtual/kfd/kfd/topology/nodes"
+
+
 def get_gpu_renderD_nodes():
     """Get the GPU renderD nodes in the system.
 
     Returns:
         list: The GPU renderD nodes in the system.
     """
+    gpu_renderDs = _gpu_renderD_nodes()
+    # Return a copy, so the callers cannot change the cached nodes.
+    return None if gpu_renderDs is None else list(gpu_renderDs)
+
+
+@functools.lru_cache(maxsize=None)
+def _gpu_renderD_nodes() -> typing.Optional[typing.Tuple[int, ...]]:
+    """Get the GPU renderD nodes in the system, read once.
+
+    Returns:
+        tuple: The GPU renderD nodes in the system, or None if the GPU vendor is not AMD.
+    """
     gpu_renderDs = None
     try:
         gpu_vendor = get_gpu_vendor()
@@ -697,19 +1720,21 @@ def get_gpu_renderD_nodes():
         sys.exit(1)
 
     if gpu_vendor == "AMD":
-        renderDs = (
-            subprocess.check_output(
-                "grep -r drm_render_minor /sys/devices/virtual/kfd/kfd/topology/nodes",
-                shell=True,
-            )
-            .decode("utf-8")
-            .split("\n")
-        )
-        # Get the renderD nodes, just looking at the numberic value at the end.
-        renderDs = [int(item.split()[-1]) for item in renderDs[:-1]]
+        renderDs = []
+        # Read the drm_render_minor line of the properties of each KFD topology node.
+        with os.scandir(_KFD_TOPOLOGY_NODES) as nodes:
+            for node in nodes:
+                try:
+                    with open(os.path.join(node.path, "properties"), "r") as f:
+                        for line in f:
+                            if line.startswith("drm_render_minor"):
+                                # Get the renderD node, just looking at the numberic value at the end.
+                                renderDs.append(int(line.split()[-1]))
+                                break
+                except FileNotFoundError:
+                    continue
         # Remove the 0th renderD node which is CPUs.
-        gpu_renderDs = [x for x in renderDs if x != 0]
-        gpu_renderDs.sort()
+        gpu_renderDs = tuple(sorted(x for x in renderDs if x != 0))
 
     return gpu_renderDs
 
@@ -726,6 +1751,7 @@ def get_docker_gpus() -> typing.Optional[int]:
     return None
 
 
+@functools.lru_cache(maxsize=None)
 def get_system_gpu_arch() -> str:
     """Get the GPU architecture in the system.
 
@@ -749,29 +1775,25 @@ def get_system_gpu_arch() -> str:
         sys.exit(1)
 
     if gpu_vendor == "NVIDIA":
-        gpu_name = (
-            subprocess.check_output(
-                "nvidia-smi --query-gpu=gpu_name --format=csv,noheader", shell=True
-            )
-            .decode("utf-8")
-            .strip()
-        )
-        # Define the regex pattern, matches Axxx, Hxxx, or Vxxx where x can be any digit
-        pattern = r"([AHV])(\d{3})"
-        match = re.search(pattern, gpu_name)
+        _, gpu_name = _query_nvidia_once()
+        # Matches Axxx, Hxxx, or Vxxx where x can be any digit
+        match = _NVIDIA_ARCH_RE.search(gpu_name)
         # Extract the GPU architecture from the GPU name.
         if match:
             gpu_arch = match.group(0)  # Extract the matched pattern
         else:
             raise Exception(f"Failed to get GPU architecture of NVIDIA: {gpu_name}")
+    elif gpu_vendor == "AMD" and _amdsmi_available():
+        processor_handle = amdsmi.amdsmi_get_processor_handles()[0]
+        gpu_arch = amdsmi.amdsmi_get_gpu_asic_info(processor_handle)["target_graphics_version"]
     elif gpu_vendor == "AMD":
-        gpu_arch = (
-            subprocess.check_output(
-                "/opt/rocm/bin/rocminfo |grep -o -m 1 'gfx.*'", shell=True
-            )
-            .decode("utf-8")
-            .strip()
-        )
+        rocminfo = subprocess.check_output(["/opt/rocm/bin/rocminfo"]).decode("utf-8")
+        # The first agent name starting with gfx, such as gfx90a.
+        match = _AMD_ARCH_RE.search(rocminfo)
+        if match:
+            gpu_arch = match.group(0).strip()
+        else:
+            raise Exception("Failed to get GPU architecture of AMD")
     else:
         raise Exception(f"Unsupported GPU vendor: {gpu_vendor}")
 
@@ -841,15 +1863,28 @@ def get_env_docker_args(run_envs: typing.Optional[typing.Dict] = None) -> str:
     Returns:
         str: The environment Docker arguments.
     """
-    env_args = ""
-    if run_envs:
-        for key, value in run_envs.items():
-            env_args += f"--env {key}={value} "
+    env_parts = [f"--env {key}={value}" for key, value in (run_envs or {}).items()]
+    # Keep the trailing space, as the arguments are concatenated into the docker command.
+    env_args = " ".join(env_parts) + (" " if env_parts else "")
 
     logger.debug(f"Environment Docker arguments: {env_args}")
     return env_args
 
 
+def _mount_mode(mount_data_path: typing.Dict) -> str:
+    """Get the mode of a mount data path.
+
+    Args:
+        mount_data_path (dict): The mount data path.
+
+    Returns:
+        str: "rw" if the mount is read-write, otherwise "ro".
+    """
+    if "read_write" in mount_data_path and mount_data_path["read_write"] == True:
+        return "rw"
+    return "ro"
+
+
 def get_mount_docker_args(
     mount_data_paths: typing.Optional[typing.List[typing.Dict]] = None,
 ) -> str:
@@ -867,19 +1902,13 @@ def get_mount_docker_args(
         -v /host_path:/container_path:ro specifies that the host_path is mounted to the container_path in read-only mode.
         [ { "host_path": "/host_path", "container_path": "/container_path", "read_write": False }]
     """
-    mount_args = ""
-    if mount_data_paths:
-        for mount_data_path in mount_data_paths:
-            mount_args += (
-                f"-v {mount_data_path['host_path']}:{mount_data_path['container_path']}"
-            )
-            if (
-                "read_write" in mount_data_path
-                and mount_data_path["read_write"] == True
-            ):
-                mount_args += ":rw "
-            else:
-                mount_args += ":ro "
+    mount_parts = [
+        f"-v {mount_data_path['host_path']}:{mount_data_path['container_path']}"
+        f":{_mount_mode(mount_data_path)}"
+        for mount_data_path in mount_data_paths or []
+    ]
+    # Keep the trailing space, as the arguments are concatenated into the docker command.
+    mount_args = " ".join(mount_parts) + (" " if mount_parts else "")
 
     logger.debug(f"Mount Docker arguments: {mount_args}")
     return mount_args
@@ -894,12 +1923,12 @@ def get_base_docker(dockerfile: str) -> str:
     Returns:
         str: The base Docker image.
     """
+    # Stream the Dockerfile, and stop at the ARG BASE_DOCKER line.
     with open(dockerfile, "r") as f:
-        lines = f.readlines()
-
-    for line in lines:
-        if "ARG BASE_DOCKER" in line:
-            return line.split("=")[-1].replace("\n", "").strip()
+        for line in f:
+            match = _BASE_DOCKER_RE.match(line)
+            if match:
+                return match.group(1)
 
     return ""
 
@@ -922,6 +1951,7 @@ def get_base_docker_sha(base_docker: str) -> str:
     )
 
 
+@functools.lru_cache(maxsize=None)
 def get_host_name() -> str:
     """Get the host name.
 
@@ -933,6 +1963,57 @@ def get_host_name() -> str:
     return host_name
 
 
+def refresh_host_cache() -> None:
+    """Clear the cached results of the host probes, such as the GPU vendor and the host OS."""
+    for host_probe in (
+        get_gpu_vendor,
+        get_host_os,
+        get_system_gpus,
+        _gpu_renderD_nodes,
+        get_system_gpu_arch,
+        get_host_name,
+        _query_nvidia_once,
+        _nvml_available,
+        _amdsmi_available,
+    ):
+        host_probe.cache_clear()
+
+
+# Decoded json files, keyed by the absolute path, with the modification time, size and
+# inode of the file they were decoded from. One entry is kept per path.
+_JSON_CACHE: typing.Dict[str, typing.Tuple[typing.Tuple[int, int, int], typing.Any]] = {}
+
+
+def _load_json_cached(js: str) -> typing.Any:
+    """Load a json file, decoding it again only when the file has changed.
+
+    Args:
+        js (str): The json file.
+
+    Returns:
+        typing.Any: The decoded json, shared between the callers.
+
+    Raises:
+        FileNotFoundError: If the json file does not exist.
+    """
+    path = os.path.abspath(js)
+    st = os.stat(path)
+    stat_key = (st.st_mtime_ns, st.st_size, st.st_ino)
+    cached = _JSON_CACHE.get(path)
+    if cached is not None and cached[0] == stat_key:
+        value = cached[1]
+    else:
+        # Decode with orjson if it is installed, otherwise with the standard json module.
+        if orjson is not None:
+            with open(js, "rb") as f:
+                value = orjson.loads(f.read())
+        else:
+            with open(js, "r") as f:
+                value = json.load(f)
+        _JSON_CACHE[path] = (stat_key, value)
+    return value
+
+
 def load_models() -> typing.List[typing.Dict]:
     """Load the models from the models.json file.
 
@@ -940,8 +2021,8 @@ def load_models() -> typing.List[typing.Dict]:
         typing.List[typing.Dict]: The models.
     """
     try:
-        with open("models.json", "r") as f:
-            models = json.load(f)
+        # Copy the models, so the callers cannot change the cached ones.
+        models = [dict(model) for model in _load_json_cached("models.json")]
     except FileNotFoundError as e:
         logger.error(f"Failed to load models: {e}")
         sys.exit(1)
@@ -973,6 +2054,32 @@ def read_log_file(log_file: str) -> str:
         sys.exit(1)
 
 
+def _scan_log_fd(
+    fd: int,
+    pattern: typing.Pattern[bytes],
+    max_matches: typing.Optional[int] = None,
+) -> typing.List[typing.Tuple[str, ...]]:
+    """Scan an open, non-empty log file for a pattern through a memory map.
+
+    Args:
+        fd (int): The file descriptor of the log file.
+        pattern (typing.Pattern[bytes]): The compiled bytes pattern.
+        max_matches (typing.Optional[int]): Stop scanning after this many matches. Defaults to None (scan the whole file).
+
+    Returns:
+        typing.List[typing.Tuple[str, ...]]: The groups of each match, decoded from UTF-8.
+    """
+    matches = []
+    with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+        for match in pattern.finditer(mm):
+            matches.append(
+                tuple(group.decode("utf-8", "ignore") for group in match.groups(b""))
+            )
+            if max_matches is not None and len(matches) >= max_matches:
+                break
+    return matches
+
+
 def get_perf_metric(log_file: str) -> typing.Tuple[str, str]:
     """Parse the performance metric.
 
@@ -992,26 +2099,30 @@ def get_perf_metric(log_file: str) -> typing.Tuple[str, str]:
     metric = ""
 
     # Search 'performance:' and 'metric:' in the log file, if found, extract the values.
-    if not os.path.exists(log_file):
+    # Open the log file once, and check its size on the open file descriptor.
+    try:
+        fd = os.open(log_file, os.O_RDONLY)
+    except FileNotFoundError:
         logger.error(f"Log file {log_file} does not exist")
         raise Exception(f"Log file {log_file} does not exist")
 
-    # Check if the log file is empty.
-    if os.stat(log_file).st_size == 0:
-        logger.error(f"Log file {log_file} is empty")
-        raise Exception(f"Log file {log_file} is empty")
+    try:
+        # Check if the log file is empty.
+        if os.fstat(fd).st_size == 0:
+            logger.error(f"Log file {log_file} is empty")
+            raise Exception(f"Log file {log_file} is empty")
 
-    log_content = read_log_file(log_file)
+        # Only the first 'performance:' line is used, so stop scanning there.
+        perf_matches = _scan_log_fd(fd, _PERF_RE, max_matches=1)
+    finally:
+        os.close(fd)
 
     # Check if the log file contains 'performance:' and 'metric:'.
-    if not re.search("performance:", log_content):
+    if not perf_matches:
         logger.error(f"Log file {log_file} does not contain performance")
         raise Exception(f"Log file {log_file} does not contain performance")
     else:
-        perf_regex = ".*performance:\\s*([+|-]?\d*[.]?\d*)\\s*.*\\s*"
-        perf = re.search(perf_regex, log_content).group(1)
-        metric_regex = ".*performance:\\s*[+|-]?\d*[.]?\d*\\s*(\w*)\\s*"
-        metric = re.search(metric_regex, log_content).group(1)
+        perf, metric = perf_matches[0]
 
     return perf, metric
 
@@ -1026,17 +2137,42 @@ def update_dict(d: typing.Dict, u: typing.Dict) -> typing.Dict:
     Returns:
         dict: The updated dictionary
     """
-    for k, v in u.items():
-        if isinstance(v, collections.abc.Mapping):
-            d[k] = update_dict(d.get(k, {}), v)
-        else:
-            d[k] = v
+    # Walk the nested mappings with an explicit stack of (destination, source) pairs.
+    stack = [(d, u)]
+    while stack:
+        dst, src = stack.pop()
+        for k, v in src.items():
+            if isinstance(v, collections.abc.Mapping):
+                child = dst.get(k)
+                if not isinstance(child, collections.abc.MutableMapping):
+                    child = dst[k] = {}
+                stack.append((child, v))
+            else:
+                dst[k] = v
     return d
 
 
 # ==================================================================================================
 # Performance CSV functions
 # ==================================================================================================
+def read_csv(csv_file: str) -> pd.DataFrame:
+    """Reads a csv file, with the multithreaded pyarrow parser if it is installed
+
+    Args:
+        csv_file (str): The csv file
+
+    Returns:
+        pd.DataFrame: The csv file as a dataframe
+    """
+    if pyarrow is not None:
+        try:
+            return pd.read_csv(csv_file, engine="pyarrow")
+        except (ImportError, ValueError) as e:
+            # pandas rejects a pyarrow version it does not support, use the C parser instead.
+            logger.debug(f"Failed to read {csv_file} with pyarrow, falling back to the C parser: {e}")
+    return pd.read_csv(csv_file)
+
+
 def df_strip_columns(df: pd.DataFrame) -> pd.DataFrame:
     """Strips the columns of a dataframe
 
@@ -1059,8 +2195,8 @@ def read_json(js: str) -> typing.Dict:
     Returns:
         dict: The json file as a dictionary
     """
-    with open(js, "r") as f:
-        return json.load(f)
+    # Copy the cached dictionary, since the callers update it in place (e.g. flatten_tags).
+    return dict(_load_json_cached(js))
 
 
 def flatten_tags(perf_entry: typing.Dict) -> None:
@@ -1102,47 +2238,57 @@ def perf_entry_dict_to_csv(perf_entry: typing.Dict) -> None:
     perf_entry_df_to_csv(js_df)
 
 
-def handle_single_result(perf_csv_df: pd.DataFrame, single_result: str) -> pd.DataFrame:
+def handle_single_result(
+    perf_csv_df: pd.DataFrame, single_result: str, emit_perf_entry: bool = False
+) -> pd.DataFrame:
     """Handles the single result
 
     Args:
         perf_csv_df (pd.DataFrame): The performance csv dataframe.
         single_result (str): The single result json file.
+        emit_perf_entry (bool): Whether to write the result to perf_entry.csv. Defaults to False.
 
     Returns:
         pd.DataFrame: The updated performance csv dataframe
     """
     single_result_json = read_json(single_result)
-    perf_entry_dict_to_csv(single_result_json)
-    perf_csv_df = pd.concat(
-        [perf_csv_df, pd.DataFrame(single_result_json, index=[0])], ignore_index=True
-    )
+    flatten_tags(single_result_json)
+    single_result_df = pd.DataFrame(single_result_json, index=[0])
+    if emit_perf_entry:
+        perf_entry_df_to_csv(single_result_df)
+    perf_csv_df = pd.concat([perf_csv_df, single_result_df], ignore_index=True)
     return perf_csv_df
 
 
 def handle_exception_result(
-    perf_csv_df: pd.DataFrame, exception_result: str
+    perf_csv_df: pd.DataFrame, exception_result: str, emit_perf_entry: bool = False
 ) -> pd.DataFrame:
     """Handles the exception result
 
     Args:
         perf_csv_df (pd.DataFrame): The performance csv dataframe.
         exception_result (str): The exception result json file.
+        emit_perf_entry (bool): Whether to write the result to perf_entry.csv. Defaults to False.
 
     Returns:
         pd.DataFrame: The updated performance csv dataframe
     """
     exception_result_json = read_json(exception_result)
-    perf_entry_dict_to_csv(exception_result_json)
-    perf_csv_df = pd.concat(
-        [perf_csv_df, pd.DataFrame(exception_result_json, index=[0])], ignore_index=True
-    )
+    flatten_tags(exception_result_json)
+    exception_result_df = pd.DataFrame(exception_result_json, index=[0])
+    if emit_perf_entry:
+        perf_entry_df_to_csv(exception_result_df)
+    perf_csv_df = pd.concat([perf_csv_df, exception_result_df], ignore_index=True)
 
     return perf_csv_df
 
 
 def handle_multiple_results(
-    perf_csv_df: pd.DataFrame, multiple_results: str, common_info: str, model_name: str
+    perf_csv_df: pd.DataFrame,
+    multiple_results: str,
+    common_info: str,
+    model_name: str,
+    emit_perf_entry: bool = False,
 ) -> pd.DataFrame:
     """Handles the multiple results
 
@@ -1151,6 +2297,7 @@ def handle_multiple_results(
         multiple_results (str): The multiple results json file.
         common_info (str): The common information json file.
         model_name (str): The model name.
+        emit_perf_entry (bool): Whether to write the results to perf_entry.csv. Defaults to False.
 
     Returns:
         pd.DataFrame: The updated performance csv dataframe
@@ -1160,7 +2307,7 @@ def handle_multiple_results(
         RuntimeError: If the multiple results CSV file is missing the model, performance, or metric column
     """
     # Check that the multiple results CSV has three columns and has the following format: model, performance, metric
-    multiple_results_df = df_strip_columns(pd.read_csv(multiple_results))
+    multiple_results_df = df_strip_columns(read_csv(multiple_results))
     multiple_results_header = multiple_results_df.columns.tolist()
 
     # Check that the multiple results CSV has three columns
@@ -1182,32 +2329,24 @@ def handle_multiple_results(
     # Flatten the tags
     flatten_tags(common_info_json)
 
-    # Create a new dataframe to store the final results
-    final_multiple_results_df = pd.DataFrame()
-
-    # Add results to perf.csv
-    for r in multiple_results_df.to_dict(orient="records"):
-        row = common_info_json
-        row["model"] = model_name + "_" + str(r["model"])
-        row["performance"] = r["performance"]
-        row["metric"] = r["metric"]
-
-        if r["performance"] is not None and pd.notna(r["performance"]):
-            row["status"] = "SUCCESS"
-        else:
-            row["status"] = "FAILURE"
-
-        # Check that the number of columns in the row is the same as the number of columns in the CSV
-        # assert perf_csv_df.columns.size == len(row)
-        # Add the row to the final results dataframe
-        final_multiple_results_df = pd.concat(
-            [final_multiple_results_df, pd.DataFrame(row, index=[0])], ignore_index=True
+    # Broadcast the common information to every row, keeping the columns of the results
+    common_columns = {
+        k: v for k, v in common_info_json.items() if k not in headings + ["status"]
+    }
+    # Build the final results with column operations, and order the columns to match the perf.csv
+    final_multiple_results_df = (
+        multiple_results_df.assign(**common_columns)
+        .assign(
+            model=model_name + "_" + multiple_results_df["model"].astype(str),
+            status=np.where(
+                multiple_results_df["performance"].notna(), "SUCCESS", "FAILURE"
+            ),
         )
-
-    # Reorder the columns to match the perf.csv
-    final_multiple_results_df = final_multiple_results_df[perf_csv_df.columns]
-    # Write the final results to a CSV file
-    perf_entry_df_to_csv(final_multiple_results_df)
+        .reindex(columns=perf_csv_df.columns)
+    )
+    # Write the final results to a CSV file, if requested
+    if emit_perf_entry:
+        perf_entry_df_to_csv(final_multiple_results_df)
     # Concatenate the final results to the perf.csv
     perf_csv_df = pd.concat([perf_csv_df, final_multiple_results_df])
     return perf_csv_df
@@ -1263,18 +2402,20 @@ def update_perf_csv(
         perf_csv_df = pd.DataFrame(columns=columns)
     else:
         # Read the perf.csv
-        perf_csv_df = df_strip_columns(pd.read_csv(perf_csv))
+        perf_csv_df = df_strip_columns(read_csv(perf_csv))
     logger.info(perf_csv_df)
     
     # Handle the results
     if multiple_results:
         perf_csv_df = handle_multiple_results(
-            perf_csv_df, multiple_results, common_info, model_name
+            perf_csv_df, multiple_results, common_info, model_name, emit_perf_entry=True
         )
     elif single_result:
-        perf_csv_df = handle_single_result(perf_csv_df, single_result)
+        perf_csv_df = handle_single_result(perf_csv_df, single_result, emit_perf_entry=True)
     elif exception_result:
-        perf_csv_df = handle_exception_result(perf_csv_df, exception_result)
+        perf_csv_df = handle_exception_result(
+            perf_csv_df, exception_result, emit_perf_entry=True
+        )
     else:
         raise RuntimeError(
             "At least one of the following must be provided: single_result, exception_result, failed_result, multiple_results"